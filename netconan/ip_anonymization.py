@@ -102,6 +102,11 @@ class _BaseIpAnonymizer(object):
             anon_bits = self._anonymize_bits(to_anon) + to_preserve
         return int(anon_bits, 2)
 
+    def anonymize_many(self, ip_ints):
+        """Return a list of the anonymized ints for each of the given ints."""
+        anonymize = self.anonymize
+        return [anonymize(ip_int) for ip_int in ip_ints]
+
     def _anonymize_bits(self, bits):
         ret = self.cache.get(bits)
         if ret is not None:
@@ -162,6 +167,11 @@ class _BaseIpAnonymizer(object):
     def get_addr_pattern(cls):
         raise NotImplementedError()
 
+    @classmethod
+    @abstractmethod
+    def get_addr_separator(cls):
+        raise NotImplementedError()
+
     @classmethod
     @abstractmethod
     def make_addr(cls, addr_str):
@@ -195,8 +205,6 @@ class IpAnonymizer(_BaseIpAnonymizer):
 
     DEFAULT_PRESERVED_PREFIXES = IPV4_CLASSES + RFC_1918_NETWORKS
 
-    _DROP_ZEROS_PATTERN = re.compile(r"0*(\d+)\.0*(\d+)\.0*(\d+)\.0*(\d+)")
-
     def __init__(self, salt, preserve_prefixes=None, preserve_addresses=None, **kwargs):
         """Create an anonymizer using the specified salt."""
         super(IpAnonymizer, self).__init__(salt, 32, **kwargs)
@@ -243,6 +251,11 @@ class IpAnonymizer(_BaseIpAnonymizer):
         """Return a compiled regex pattern to recognize IPv4 addresses."""
         return IPv4_PATTERN
 
+    @classmethod
+    def get_addr_separator(cls):
+        """Return the character that every IPv4 address contains."""
+        return "."
+
     @classmethod
     def make_addr(cls, addr_str):
         """
@@ -252,7 +265,10 @@ class IpAnonymizer(_BaseIpAnonymizer):
         those zeros will be ignored (1.2.3.40) -- they will NOT be interpreted
         as octal (1.2.3.32).
         """
-        addr_str = IpAnonymizer._DROP_ZEROS_PATTERN.sub(r"\1.\2.\3.\4", addr_str)
+        # Keep one zero for all-zero octets, but leave empty octets empty
+        addr_str = ".".join(
+            [octet.lstrip("0") or octet[:1] for octet in addr_str.split(".")]
+        )
         return ipaddress.IPv4Address(_ensure_unicode(addr_str))
 
     @classmethod
@@ -280,6 +296,11 @@ class IpV6Anonymizer(_BaseIpAnonymizer):
         """Return a compiled regex pattern to recognize IPv6 addresses."""
         return IPv6_PATTERN
 
+    @classmethod
+    def get_addr_separator(cls):
+        """Return the character that every IPv6 address contains."""
+        return ":"
+
     @classmethod
     def make_addr(cls, addr_str):
         """Return an IPv6 address from the given string."""
@@ -322,6 +343,11 @@ def anonymize_ip_addr(anonymizer, line, undo_ip_anon=False):
     treated as an address already anonymized using the specified salt, and it
     will be replaced with the unanonymized address.
     """
+    # Skip the (comparatively slow) regex scan for lines that cannot contain
+    # an address, which is most lines in a typical config
+    if anonymizer.get_addr_separator() not in line:
+        return line
+
     pattern = anonymizer.get_addr_pattern()
     return pattern.sub(
         lambda match: _anonymize_match(anonymizer, match.group(0), undo_ip_anon), line
@@ -0,0 +1,58 @@
+"""Fixtures shared by the unit tests."""
+#   Copyright 2018 Intentionet
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+import pytest
+
+from netconan.ip_anonymization import IpAnonymizer
+
+
+def _flip_salter(salt, bits):
+    """Flip every bit that is not preserved."""
+    return 1
+
+
+@pytest.fixture(scope="session")
+def anon_factory():
+    """Create a factory for IPv4 anonymizers shared across the test session.
+
+    Building the IP tree for preserved prefixes dominates the cost of most
+    tests, so anonymizers with identical configurations are only built once.
+    Prefixes and addresses must be passed as tuples so they can be cache keys.
+    """
+    anonymizers = {}
+
+    def build(
+        salt,
+        preserve_prefixes=None,
+        preserve_addresses=None,
+        preserve_suffix=None,
+        flip=False,
+    ):
+        key = (salt, preserve_prefixes, preserve_addresses, preserve_suffix, flip)
+        anonymizer = anonymizers.get(key)
+        if anonymizer is None:
+            kwargs = {"preserve_suffix": preserve_suffix}
+            if flip:
+                kwargs["salter"] = _flip_salter
+            if preserve_prefixes is not None:
+                # The anonymizer extends the prefix list, so give it a copy
+                kwargs["preserve_prefixes"] = list(preserve_prefixes)
+            anonymizer = IpAnonymizer(
+                salt, preserve_addresses=preserve_addresses, **kwargs
+            )
+            anonymizers[key] = anonymizer
+        return anonymizer
+
+    return build
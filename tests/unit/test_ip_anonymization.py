@@ -16,6 +16,7 @@
 from __future__ import unicode_literals
 
 import ipaddress
+import mmap
 import re
 
 import pytest
@@ -63,6 +64,10 @@ ip_v6_list = [
     ("ffff:eeee:dddd:cccc:bbbb:AaAa:9999:8888"),
 ]
 
+# Parsing only depends on the address family, so parse each address once
+ip_v4_int_list = [int(IpAnonymizer.make_addr(s)) for s in ip_v4_list]
+ip_v6_int_list = [int(IpV6Anonymizer.make_addr(s)) for s in ip_v6_list]
+
 # Private-use blocks defined at https://www.iana.org/assignments/iana-ipv4-special-registry/iana-ipv4-special-registry.xhtml
 # Tuples consist of: start of block, end of block, block subnet
 private_blocks = [
@@ -71,13 +76,30 @@ private_blocks = [
     ("192.168.0.0", "192.168.255.255", "192.168.0.0/16"),
 ]
 
+
+def _network_and_mask(subnet):
+    """Return the int network address and netmask of the given subnet."""
+    network = ipaddress.ip_network(_ensure_unicode(subnet))
+    return int(network.network_address), int(network.netmask)
+
+
+# Int network address and netmask for each private-use block, keyed by subnet
+private_block_networks = {
+    subnet: _network_and_mask(subnet) for _, _, subnet in private_blocks
+}
+
 SALT = "saltForTest"
 
+# Matches each "<original>\t<anonymized>" line in the raw bytes of an IP tree dump
+_DUMP_LINE_PATTERN = re.compile(
+    br"[ \t]*(\d+\.\d+\.\d+\.\d+)[ \t]+(\d+\.\d+\.\d+\.\d+)[ \t\r]*\n"
+)
+
 
-@pytest.fixture(scope="module")
-def anonymizer_v4():
+@pytest.fixture(scope="session")
+def anonymizer_v4(anon_factory):
     """Most tests in this module use a single IPv4 anonymizer."""
-    return IpAnonymizer(SALT)
+    return anon_factory(SALT)
 
 
 @pytest.fixture(scope="module")
@@ -86,24 +108,40 @@ def anonymizer_v6():
     return IpV6Anonymizer(SALT)
 
 
-@pytest.fixture(scope="module")
-def anonymizer(request):
+@pytest.fixture(scope="session")
+def anonymizer(request, anon_factory):
     """Create a generic fixture for different types of anonymizers."""
     if request.param == "v4":
-        return IpAnonymizer(SALT)
+        return anon_factory(SALT)
     elif request.param == "v6":
         return IpV6Anonymizer(SALT)
     elif request.param == "flipv4":
-        return IpAnonymizer(SALT, salter=lambda a, b: 1)
+        return anon_factory(SALT, flip=True)
     else:
         raise ValueError("Invalid anonymizer type {}".format(request.param))
 
 
-@pytest.fixture(scope="module")
-def flip_anonymizer_v4():
+@pytest.fixture(scope="session")
+def flip_anonymizer_v4(anon_factory):
     """Create an anonymizer that flips every bit except for class bits."""
     # Don't preserve private blocks, because that reduces the number of bits flipped
-    return IpAnonymizer(SALT, preserve_prefixes=ip_v4_classes, salter=lambda a, b: 1)
+    return anon_factory(SALT, preserve_prefixes=tuple(ip_v4_classes), flip=True)
+
+
+@pytest.fixture(scope="module")
+def bit_masks(anonymizer):
+    """Create the masks used to compare addresses differing in a single bit.
+
+    The ith diff mask selects bit i and the ith same mask selects every bit
+    above it, i.e. the prefix shared by addresses differing only in bit i.
+    """
+    full_bit_mask = (1 << anonymizer.length) - 1
+    diff_masks = [1 << i for i in range(anonymizer.length)]
+    # Using i + 1 since same_mask should mask off ith bit, not preserve it
+    same_masks = [
+        full_bit_mask & (full_bit_mask << (i + 1)) for i in range(anonymizer.length)
+    ]
+    return diff_masks, same_masks
 
 
 def anonymize_line_general(anonymizer, line, ip_addrs):
@@ -124,6 +162,23 @@ def anonymize_line_general(anonymizer, line, ip_addrs):
         assert ip_addr not in anon_line
 
 
+@pytest.mark.parametrize(
+    "anonymizer,line",
+    [("v4", "ip address 1.2.3.4"), ("v6", "ipv6 address 1::1")],
+    indirect=["anonymizer"],
+)
+def test_addr_pattern_precompiled(monkeypatch, anonymizer, line):
+    """Test that anonymizing a line does not compile any regex."""
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Regex compiled while anonymizing a line")
+
+    # Module-level helpers compile their pattern argument implicitly
+    for name in ("compile", "match", "search", "sub", "subn", "finditer"):
+        monkeypatch.setattr(re, name, fail)
+    assert anonymize_ip_addr(anonymizer, line) != line
+
+
 @pytest.mark.parametrize(
     "line, ip_addrs",
     [
@@ -153,12 +208,12 @@ def test_v4_anonymize_line(anonymizer_v4, line, ip_addrs):
     anonymize_line_general(anonymizer_v4, line, ip_addrs)
 
 
-@pytest.mark.parametrize("enclosing", "_:;[]$~!@#$%^&*()-+=[]|<>?")
-def test_v4_anonymize_enclosed_addr(anonymizer_v4, enclosing):
+def test_v4_anonymize_enclosed_addr(anonymizer_v4):
     """Test IPv4 address removal from config lines with different enclosing characters."""
     ip_addr = "1.2.3.4"
-    line = enclosing + "{}" + enclosing
-    anonymize_line_general(anonymizer_v4, line, [ip_addr])
+    for enclosing in "_:;[]$~!@#$%^&*()-+=[]|<>?":
+        line = enclosing + "{}" + enclosing
+        anonymize_line_general(anonymizer_v4, line, [ip_addr])
 
 
 @pytest.mark.parametrize(
@@ -178,38 +233,29 @@ def test_v6_anonymize_line(anonymizer_v6, line, ip_addrs):
     anonymize_line_general(anonymizer_v6, line, ip_addrs)
 
 
-@pytest.mark.parametrize("enclosing", ".;[]$~!@#$%^&*()-+=[]|<>?")
-def test_v6_anonymize_enclosed_addr(anonymizer_v6, enclosing):
+def test_v6_anonymize_enclosed_addr(anonymizer_v6):
     """Test IPv6 address removal from config lines with different enclosing characters."""
     ip_addr = "1::1"
-    line = enclosing + "{}" + enclosing
-    anonymize_line_general(anonymizer_v6, line, [ip_addr])
+    for enclosing in ".;[]$~!@#$%^&*()-+=[]|<>?":
+        line = enclosing + "{}" + enclosing
+        anonymize_line_general(anonymizer_v6, line, [ip_addr])
+
+
+# IPv4 class and class mask, indexed by the top 4 bits of an address
+_IP_V4_CLASS_BY_NIBBLE = tuple("AAAAAAAABBBBCCDE")
+_IP_V4_CLASS_MASK_BY_NIBBLE = (
+    (0x80000000,) * 8 + (0xC0000000,) * 4 + (0xE0000000,) * 2 + (0xF0000000,) * 2
+)
 
 
 def get_ip_v4_class(ip_int):
     """Return the letter corresponding to the IP class the ip_int is in."""
-    if (ip_int & 0x80000000) == 0x00000000:
-        return "A"
-    elif (ip_int & 0xC0000000) == 0x80000000:
-        return "B"
-    elif (ip_int & 0xE0000000) == 0xC0000000:
-        return "C"
-    elif (ip_int & 0xF0000000) == 0xE0000000:
-        return "D"
-    else:
-        return "E"
+    return _IP_V4_CLASS_BY_NIBBLE[ip_int >> 28]
 
 
 def get_ip_v4_class_mask(ip_int):
     """Return a mask indicating bits preserved when preserving class."""
-    if (ip_int & 0xE0000000) == 0xE0000000:
-        return 0xF0000000
-    elif (ip_int & 0xC0000000) == 0xC0000000:
-        return 0xE0000000
-    elif (ip_int & 0x80000000) == 0x80000000:
-        return 0xC0000000
-    else:
-        return 0x80000000
+    return _IP_V4_CLASS_MASK_BY_NIBBLE[ip_int >> 28]
 
 
 @pytest.mark.parametrize(
@@ -243,10 +289,10 @@ def test_v4_class_preserved(flip_anonymizer_v4, ip_addr):
     assert 0xFFFFFFFF ^ class_mask == ip_int ^ ip_int_anon
 
 
-def test_preserve_custom_prefixes():
+def test_preserve_custom_prefixes(anon_factory):
     """Test that a custom prefix is preserved correctly."""
     subnet = "170.0.0.0/8"
-    anonymizer = IpAnonymizer(SALT, [subnet])
+    anonymizer = anon_factory(SALT, preserve_prefixes=(subnet,))
 
     ip_start = int(anonymizer.make_addr("170.0.0.0"))
     ip_start_anon = anonymizer.anonymize(ip_start)
@@ -254,24 +300,24 @@ def test_preserve_custom_prefixes():
     ip_end = int(anonymizer.make_addr("170.255.255.255"))
     ip_end_anon = anonymizer.anonymize(ip_end)
 
-    network = ipaddress.ip_network(_ensure_unicode(subnet))
+    network_int, mask = _network_and_mask(subnet)
 
     # Make sure the anonymized addresses are different from the originals
     assert ip_start_anon != ip_start
     assert ip_end_anon != ip_end
 
     # Make sure the anonymized addresses have the same prefix as the originals
-    assert ipaddress.ip_address(ip_start_anon) in network
-    assert ipaddress.ip_address(ip_end_anon) in network
+    assert ip_start_anon & mask == network_int
+    assert ip_end_anon & mask == network_int
 
 
-def test_preserve_custom_addresses():
+def test_preserve_custom_addresses(anon_factory):
     """Test that addresses within a preserved block are flagged correctly as NOT needing anonymization."""
-    addresses = [
+    addresses = (
         "170.0.0.0/8",
         "11.11.11.11",
-    ]
-    anonymizer = IpAnonymizer(SALT, preserve_addresses=addresses)
+    )
+    anonymizer = anon_factory(SALT, preserve_addresses=addresses)
 
     ip_start = int(anonymizer.make_addr("170.0.0.0"))
     ip_end = int(anonymizer.make_addr("170.255.255.255"))
@@ -287,21 +333,22 @@ def test_preserve_custom_addresses():
     assert anonymizer.should_anonymize(ip_outside)
 
 
-def test_preserve_address_preserves_prefix():
+def test_preserve_address_preserves_prefix(anon_factory):
     """Test that common prefixes are still preserved when addresses are preserved."""
     addr_str = "11.11.11.11"
     addr = ipaddress.ip_address(addr_str)
     addr_int = int(addr)
 
-    anonymizer = IpAnonymizer(SALT, preserve_addresses=[addr_str])
+    anonymizer = anon_factory(SALT, preserve_addresses=(addr_str,))
+
+    # Anonymize addresses similar to the original, each with 1 bit flipped
+    similar_ints = [addr_int ^ (1 << i) for i in range(addr.max_prefixlen)]
+    similar_anon_ints = anonymizer.anonymize_many(similar_ints)
 
-    addr_len = addr.max_prefixlen
-    for i in range(addr_len):
-        # Anonymize an address similar to the original, with 1 bit flipped
-        similar_addr = ipaddress.ip_address(addr_int ^ (1 << i))
-        similar_anon = ipaddress.ip_address(anonymizer.anonymize(int(similar_addr)))
-        # Confirm cpl before anonymization matches cpl after anonymization
-        assert _cpl_v4(similar_anon, addr) == _cpl_v4(similar_addr, addr)
+    # Confirm cpl before anonymization matches cpl after anonymization
+    assert [_cpl_v4(anon, addr_int) for anon in similar_anon_ints] == [
+        _cpl_v4(similar, addr_int) for similar in similar_ints
+    ]
 
 
 def _cpl_v4(left, right):
@@ -313,12 +360,7 @@ def _cpl_v4(left, right):
     _cpl_v4(1.0.0.1, 1.0.128.1) == 16
     _cpl_v4(1.0.0.1, 128.0.0.1) == 0
     """
-    xor = int(left) ^ int(right)
-    max_shift = 32
-    for i in reversed(range(max_shift)):
-        if xor & (0x1 << i):
-            return max_shift - 1 - i
-    return max_shift
+    return 32 - (int(left) ^ int(right)).bit_length()
 
 
 @pytest.mark.parametrize("start, end, subnet", private_blocks)
@@ -330,24 +372,30 @@ def test_preserve_private_prefixes(anonymizer_v4, start, end, subnet):
     ip_int_end = int(anonymizer_v4.make_addr(end))
     ip_int_end_anon = anonymizer_v4.anonymize(ip_int_end)
 
-    network = ipaddress.ip_network(_ensure_unicode(subnet))
+    network_int, mask = private_block_networks[subnet]
 
     # Make sure addresses in the block stay in the block
-    assert ipaddress.ip_address(ip_int_start_anon) in network
-    assert ipaddress.ip_address(ip_int_end_anon) in network
+    assert ip_int_start_anon & mask == network_int
+    assert ip_int_end_anon & mask == network_int
+
+
+def _expected_flipped(length):
+    """Return 0 anonymized by a bit-flipping anonymizer preserving <length> host bits.
+
+    The first <32-length> bits are 1, the last <length> bits are all 0.
+    """
+    return ((1 << (32 - length)) - 1) << length
 
 
 @pytest.mark.parametrize("length", range(0, 33))
-def test_preserve_host_bits(length):
+def test_preserve_host_bits(anon_factory, length):
     """Test that host bits are preserved, for every length."""
-    anonymizer = IpAnonymizer(
-        salt=SALT, salter=lambda a, b: 1, preserve_suffix=length, preserve_prefixes=[]
+    anonymizer = anon_factory(
+        SALT, preserve_prefixes=(), preserve_suffix=length, flip=True
     )
     anonymized = anonymizer.anonymize(0)
 
-    # The first <32-length> bits are 1, the last <length> bits are all 0
-    expected = "1" * (32 - length) + "0" * length
-    assert "{:032b}".format(anonymized) == expected
+    assert anonymized == _expected_flipped(length)
 
     # Deanonymization flips the bits back
     deanonymized = anonymizer.deanonymize(anonymized)
@@ -355,30 +403,26 @@ def test_preserve_host_bits(length):
 
 
 @pytest.mark.parametrize(
-    "anonymizer,ip_addr",
-    [("v4", s) for s in ip_v4_list] + [("v6", s) for s in ip_v6_list],
+    "anonymizer,ip_int",
+    [("v4", i) for i in ip_v4_int_list] + [("v6", i) for i in ip_v6_int_list],
+    ids=ip_v4_list + ip_v6_list,
     indirect=["anonymizer"],
+    scope="module",
 )
-def test_anonymize_addr(anonymizer, ip_addr):
+def test_anonymize_addr(anonymizer, bit_masks, ip_int):
     """Test conversion from original to anonymized IP address."""
-    ip_int = int(anonymizer.make_addr(ip_addr))
     ip_int_anon = anonymizer.anonymize(ip_int)
 
     # Anonymized ip address should not match the original address
     assert ip_int != ip_int_anon
 
-    full_bit_mask = (1 << anonymizer.length) - 1
-
     # Confirm prefixes for similar addresses are preserved after anonymization
-    for i in range(0, anonymizer.length):
-        # Flip the ith bit of the org address and use that as the similar address
-        diff_mask = 1 << i
+    diff_masks, same_masks = bit_masks
+    for diff_mask, same_mask in zip(diff_masks, same_masks):
+        # Flip one bit of the org address and use that as the similar address
         ip_int_similar = ip_int ^ diff_mask
         ip_int_similar_anon = anonymizer.anonymize(ip_int_similar)
 
-        # Using i + 1 since same_mask should mask off ith bit, not preserve it
-        same_mask = full_bit_mask & (full_bit_mask << (i + 1))
-
         # Common prefix for addresses should match after anonymization
         assert ip_int_similar_anon & same_mask == ip_int_anon & same_mask
 
@@ -386,38 +430,39 @@ def test_anonymize_addr(anonymizer, ip_addr):
         assert ip_int_similar_anon & diff_mask != ip_int_anon & diff_mask
 
 
+@pytest.mark.parametrize(
+    "anonymizer_cls,ip_ints",
+    [(IpAnonymizer, ip_v4_int_list), (IpV6Anonymizer, ip_v6_int_list)],
+    ids=["v4", "v6"],
+)
+def test_anonymize_many_matches_scalar(anonymizer_cls, ip_ints):
+    """Test that batch anonymization matches anonymizing one address at a time."""
+    # Use separate anonymizers so neither path reads cache entries from the other
+    scalar_anonymizer = anonymizer_cls(SALT)
+    expected = [scalar_anonymizer.anonymize(ip_int) for ip_int in ip_ints]
+    assert anonymizer_cls(SALT).anonymize_many(ip_ints) == expected
+
+
 def test_anonymize_ip_order_independent():
     """Test to make sure order does not affect anonymization of addresses."""
-    anonymizer_v4_forward = IpAnonymizer(SALT)
-    ip_lookup_forward = {}
-    for ip_addr in ip_v4_list:
-        ip_int = int(anonymizer_v4_forward.make_addr(ip_addr))
-        ip_int_anon = anonymizer_v4_forward.anonymize(ip_int)
-        ip_lookup_forward[ip_int] = ip_int_anon
-
-    anonymizer_v4_reverse = IpAnonymizer(SALT)
-    for ip_addr in reversed(ip_v4_list):
-        ip_int_reverse = int(anonymizer_v4_reverse.make_addr(ip_addr))
-        ip_int_anon_reverse = anonymizer_v4_reverse.anonymize(ip_int_reverse)
-        # Confirm anonymizing in reverse order does not affect
-        # anonymization results
-        assert ip_int_anon_reverse == ip_lookup_forward[ip_int_reverse]
+    ip_ints_anon = IpAnonymizer(SALT).anonymize_many(ip_v4_int_list)
+
+    # Confirm anonymizing in reverse order does not affect anonymization results
+    ip_ints_anon_reverse = IpAnonymizer(SALT).anonymize_many(reversed(ip_v4_int_list))
+    assert ip_ints_anon_reverse[::-1] == ip_ints_anon
 
     anonymizer_v4_extras = IpAnonymizer(SALT)
-    for ip_addr in ip_v4_list:
-        ip_int_extras = int(anonymizer_v4_extras.make_addr(ip_addr))
-        ip_int_anon_extras = anonymizer_v4_extras.anonymize(ip_int_extras)
-        ip_int_inverted = ip_int_extras ^ 0xFFFFFFFF
-        anonymizer_v4_extras.anonymize(ip_int_inverted)
+    for ip_int, ip_int_anon in zip(ip_v4_int_list, ip_ints_anon):
+        ip_int_anon_extras = anonymizer_v4_extras.anonymize(ip_int)
+        anonymizer_v4_extras.anonymize(ip_int ^ 0xFFFFFFFF)
         # Confirm anonymizing with extra addresses in-between does not
         # affect anonymization results
-        assert ip_int_anon_extras == ip_lookup_forward[ip_int_extras]
+        assert ip_int_anon_extras == ip_int_anon
 
 
-@pytest.mark.parametrize("ip_addr", ip_v4_list)
-def test_deanonymize_ip(anonymizer_v4, ip_addr):
+@pytest.mark.parametrize("ip_int", ip_v4_int_list, ids=ip_v4_list)
+def test_deanonymize_ip(anonymizer_v4, ip_int):
     """Test reversing IP anonymization."""
-    ip_int = int(anonymizer_v4.make_addr(ip_addr))
     ip_int_anon = anonymizer_v4.anonymize(ip_int)
     ip_int_unanon = anonymizer_v4.deanonymize(ip_int_anon)
 
@@ -431,9 +476,8 @@ def test_dump_iptree(tmpdir, anonymizer_v4):
     ip_mapping_from_dump = {}
 
     # Make sure all addresses to be checked are in ip_tree and generate reference mapping
-    for ip_addr_raw in ip_v4_list:
-        ip_addr = anonymizer_v4.make_addr(ip_addr_raw)
-        ip_int = int(ip_addr)
+    for ip_int in ip_v4_int_list:
+        ip_addr = anonymizer_v4.make_addr_from_int(ip_int)
         ip_int_anon = anonymizer_v4.anonymize(ip_int)
         ip_addr_anon = str(ipaddress.IPv4Address(ip_int_anon))
         ip_mapping[str(ip_addr)] = ip_addr_anon
@@ -442,21 +486,31 @@ def test_dump_iptree(tmpdir, anonymizer_v4):
     with open(filename, "w") as f_tmp:
         anonymizer_v4.dump_to_file(f_tmp)
 
-    with open(filename, "r") as f_tmp:
-        # Build mapping dict from the output of the ip_tree dump
-        for line in f_tmp.readlines():
-            m = re.match(r"\s*(\d+\.\d+.\d+.\d+)\s+(\d+\.\d+.\d+.\d+)\s*", line)
-            ip_addr = m.group(1)
-            ip_addr_anon = m.group(2)
-            ip_mapping_from_dump[ip_addr] = ip_addr_anon
+    with open(filename, "rb") as f_tmp:
+        # Build mapping dict from the output of the ip_tree dump, scanning the
+        # mapped file in one pass rather than line by line
+        dump = mmap.mmap(f_tmp.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            end = 0
+            for m in _DUMP_LINE_PATTERN.finditer(dump):
+                # Every line must parse, so each match starts where the last ended
+                assert m.start() == end
+                end = m.end()
+                ip_addr = m.group(1).decode()
+                ip_addr_anon = m.group(2).decode()
+                ip_mapping_from_dump[ip_addr] = ip_addr_anon
+            assert end == len(dump)
+        finally:
+            dump.close()
 
     for ip_addr in ip_mapping:
         # Confirm anon addresses from ip_tree dump match anon addresses from _convert_to_anon_ip
         assert ip_mapping[ip_addr] == ip_mapping_from_dump[ip_addr]
 
 
-@pytest.mark.parametrize(
-    "line",
+# Lines that contain no valid address, separated by newlines so that each line
+# is still delimited like a separate config line
+false_positives = "\n".join(
     [
         "01:23:45:67:89:ab",
         "01:02:03:04:05:06:07:08:09",
@@ -471,15 +525,40 @@ def test_dump_iptree(tmpdir, anonymizer_v4):
         "1.2.333.4",
         "1.2.0333.4",
         "1.256.3.4",
-    ],
+    ]
 )
-def test_false_positives(anonymizer_v4, anonymizer_v6, line):
+
+
+def test_false_positives(anonymizer_v4, anonymizer_v6):
     """Test that text without a valid address is not anonymized."""
-    anon_line = anonymize_ip_addr(anonymizer_v4, line)
-    anon_line = anonymize_ip_addr(anonymizer_v6, anon_line)
+    anon_lines = anonymize_ip_addr(anonymizer_v4, false_positives)
+    anon_lines = anonymize_ip_addr(anonymizer_v6, anon_lines)
 
-    # Confirm the anonymized line is unchanged
-    assert line == anon_line
+    # Confirm the anonymized lines are unchanged
+    assert false_positives == anon_lines
+
+
+@pytest.mark.parametrize("undo_ip_anon", [False, True])
+@pytest.mark.parametrize(
+    "anonymizer,line",
+    [
+        ("v4", "ipv6 address 1::1"),
+        ("v4", "hostname router1"),
+        ("v6", "ip address 1.2.3.4"),
+        ("v6", "hostname router1"),
+    ],
+    indirect=["anonymizer"],
+)
+def test_anonymize_ip_addr_skips_lines_without_separator(
+    monkeypatch, anonymizer, line, undo_ip_anon
+):
+    """Test that lines without the address separator are returned without a regex scan."""
+
+    def fail():
+        raise AssertionError("Address pattern used for a line without an address")
+
+    monkeypatch.setattr(anonymizer, "get_addr_pattern", fail)
+    assert anonymize_ip_addr(anonymizer, line, undo_ip_anon) == line
 
 
 @pytest.mark.parametrize(
@@ -506,9 +585,16 @@ def test_v4_anonymizer_ignores_leading_zeros(anonymizer_v4, zeros, no_zeros):
     assert ipaddress.IPv4Address(no_zeros) == anonymizer_v4.make_addr(zeros)
 
 
-@pytest.mark.parametrize(
-    "ip_int, expected",
-    [
+@pytest.mark.parametrize("addr", ["1..2.3", "1.2.3", "1.2.3.4.5", "1.2.3.0a"])
+def test_v4_anonymizer_make_addr_invalid(anonymizer_v4, addr):
+    """Test that stripping leading zeros does not make invalid addresses valid."""
+    with pytest.raises(ipaddress.AddressValueError):
+        anonymizer_v4.make_addr(addr)
+
+
+def test_v4_should_anonymize(anonymizer_v4):
+    """Test that the IpV4 anonymizer does not anonymize masks."""
+    ip_ints, expected = zip(
         (0b00000000000000000000000000000000, False),
         (0b00000000000000000000000000000001, False),
         (0b00000000000000000000000000001111, False),
@@ -521,8 +607,5 @@ def test_v4_anonymizer_ignores_leading_zeros(anonymizer_v4, zeros, no_zeros):
         (0b00000000000000000010000000000000, True),
         (0b00000000000000000011111111111110, True),
         (0b00000000010000000100000000000000, True),
-    ],
-)
-def test_v4_should_anonymize(anonymizer_v4, ip_int, expected):
-    """Test that the IpV4 anonymizer does not anonymize masks."""
-    assert expected == anonymizer_v4.should_anonymize(ip_int)
+    )
+    assert expected == tuple(map(anonymizer_v4.should_anonymize, ip_ints))